@@ -7,36 +7,76 @@ Supports multiple Proxmox instances via auto-discovery.
 Handles LXC mount points by temporarily removing them before snapshotting.
 """
 
+import functools
 import json
 import os
 import re
-import ssl
+import socket
 import sys
+import threading
 import time
-import urllib.error
-import urllib.request
-from datetime import datetime
 from pathlib import Path
-from typing import Any
-from urllib.parse import urlencode
+from typing import TYPE_CHECKING, Any, Callable
+
+# ssl, http.client, concurrent.futures, datetime and urllib.parse are imported where
+# they are used: the script runs once per deploy, and paths that exit early or hit
+# the discovery cache should not pay for loading them.
+if TYPE_CHECKING:
+    import http.client
+    import ssl
+
+# orjson parses API responses several times faster; fall back to the stdlib if absent.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so error handling is shared.
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 # Matches a MAC address in colon-separated hex format
 MAC_RE = re.compile(r"[0-9a-f]{2}(?::[0-9a-f]{2}){5}")
 
+# Matches an LXC mount point config key (mp0, mp1, ...)
+MP_KEY_RE = re.compile(r"mp\d+")
+
 # Configuration
-TASK_POLL_INTERVAL = 2  # seconds
+TASK_POLL_INITIAL = 0.25  # seconds - first delay between task status polls
+TASK_POLL_MAX = 5.0  # seconds - cap for the exponential poll backoff
+TASK_POLL_BACKOFF = 1.5  # multiplier applied to the delay after each poll
 TASK_TIMEOUT = 120  # seconds
 SNAPSHOT_REUSE_WINDOW = 300  # seconds - skip snapshot if one was created within this window
+DISCOVERY_MAX_HOSTS = 8  # Proxmox instances searched concurrently
+DISCOVERY_MAX_WORKERS = 16  # concurrent VM config lookups per Proxmox instance
+SNAPSHOT_MAX_WORKERS = 8  # concurrent snapshots when snapshotting several VMs
+DISCOVERY_CACHE_PATH = Path("/tmp/komodo_proxmox_map.json")
+DISCOVERY_CACHE_TTL = 300  # seconds - reuse a discovered VM location for this long
+API_PORT = 8006
+API_TIMEOUT = 30  # seconds
+API_KEEPIDLE = 30  # seconds - idle time before TCP keepalive probes start
+
+# VM/LXC configs fetched during this run, keyed by (ip, node, vm_type, vmid)
+_config_cache: dict[tuple[str, str, str, int], dict] = {}
+
+# Keep-alive connections, one per Proxmox host per thread (http.client is not thread-safe)
+_local = threading.local()
 
 
-class ApiError(Exception):
+class RequestError(Exception):
+    """Raised when a Proxmox API request cannot be completed."""
+
+    def __init__(self, msg: str, url: str):
+        self.url = url
+        super().__init__(msg)
+
+
+class ApiError(RequestError):
     """Raised when a Proxmox API request fails."""
 
     def __init__(self, status_code: int, body: str, url: str):
         self.status_code = status_code
         self.body = body
-        self.url = url
-        super().__init__(f"HTTP {status_code} from {url}: {body}")
+        super().__init__(f"HTTP {status_code} from {url}: {body}", url)
 
 
 def fatal(msg: str) -> None:
@@ -76,7 +116,106 @@ def load_config() -> dict:
     return config
 
 
-def make_request(
+@functools.cache
+def get_ssl_context() -> "ssl.SSLContext":
+    """
+    Return the TLS context shared by all connections.
+    Certificates are not verified (like curl -k), so the system CA bundle is never loaded.
+    """
+    import ssl
+
+    ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    ssl_context.check_hostname = False
+    ssl_context.verify_mode = ssl.CERT_NONE
+    return ssl_context
+
+
+def get_connection(host_config: dict) -> "http.client.HTTPSConnection":
+    """Return this thread's keep-alive connection to the given Proxmox host."""
+    import http.client
+
+    connections = getattr(_local, "connections", None)
+    if connections is None:
+        connections = _local.connections = {}
+
+    conn = connections.get(host_config["ip"])
+    if conn is None:
+        conn = http.client.HTTPSConnection(
+            host_config["ip"], API_PORT, timeout=API_TIMEOUT, context=get_ssl_context()
+        )
+        connections[host_config["ip"]] = conn
+    return conn
+
+
+def get_headers(host_config: dict) -> dict:
+    """Return the request headers for a Proxmox host, built once per host."""
+    headers = host_config.get("_headers")
+    if headers is None:
+        headers = host_config["_headers"] = {
+            "Authorization": f"PVEAPIToken={host_config['api_token']}",
+            "Content-Type": "application/x-www-form-urlencoded",
+        }
+    return headers
+
+
+def open_connection(conn: "http.client.HTTPSConnection") -> None:
+    """
+    Open the connection with TCP keepalive enabled, so NAT/firewalls keep the
+    idle socket between task polls. http.client already sets TCP_NODELAY.
+    """
+    conn.connect()
+    conn.sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    if hasattr(socket, "TCP_KEEPIDLE"):  # Linux-only option
+        conn.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, API_KEEPIDLE)
+
+
+def exchange(
+    conn: "http.client.HTTPSConnection",
+    host_config: dict,
+    method: str,
+    path: str,
+    body: bytes | None,
+) -> tuple[int, bytes]:
+    """
+    Send one request and read its response, opening the connection if needed.
+    Closes the connection on any failure, so a half-finished exchange never
+    leaves it unusable for the next request on this thread.
+    """
+    try:
+        if conn.sock is None:
+            open_connection(conn)
+        conn.request(method, path, body=body, headers=get_headers(host_config))
+        response = conn.getresponse()
+        return response.status, response.read()
+    except Exception:
+        conn.close()
+        raise
+
+
+def send_request(
+    host_config: dict, method: str, path: str, body: bytes | None
+) -> tuple[int, bytes]:
+    """
+    Send a request over the keep-alive connection and return (status, body).
+
+    If the server has closed an idle connection, reconnects and retries a GET
+    once. Other methods are never resent: the first attempt may already have
+    reached the server (e.g., started a snapshot task).
+    """
+    import http.client
+
+    conn = get_connection(host_config)
+    reused = conn.sock is not None
+    try:
+        return exchange(conn, host_config, method, path, body)
+    except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+        if not reused or method != "GET":
+            raise
+
+    return exchange(conn, host_config, method, path, body)
+
+
+def api_request(
     host_config: dict,
     method: str,
     endpoint: str,
@@ -88,47 +227,85 @@ def make_request(
     Args:
         host_config: Dict with 'url', 'api_token', 'node' keys
         method: HTTP method (GET, POST, PUT, DELETE)
-        endpoint: API endpoint (e.g., 'lxc' or 'lxc/100/config')
+        endpoint: API path below /api2/json (e.g., 'cluster/resources?type=vm')
         data: Optional data for POST/PUT requests
 
     Returns:
         Parsed JSON response
 
     Raises:
-        Exits on any error
+        ApiError: if the API returns an HTTP error status
+        RequestError: if the host is unreachable or returns invalid JSON
     """
-    url = f"https://{host_config['ip']}:8006/api2/json/nodes/{host_config['node']}/{endpoint}"
+    import http.client
+    from urllib.parse import urlencode
 
-    # Prepare request
-    headers = {
-        "Authorization": f"PVEAPIToken={host_config['api_token']}",
-        "Content-Type": "application/x-www-form-urlencoded",
-    }
+    path = f"/api2/json/{endpoint}"
+    url = f"https://{host_config['ip']}:{API_PORT}{path}"
 
     body = None
     if data is not None:
         body = urlencode(data).encode("utf-8")
 
-    req = urllib.request.Request(url, data=body, headers=headers, method=method)
+    try:
+        status, response_body = send_request(host_config, method, path, body)
+    except (OSError, http.client.HTTPException) as e:
+        raise RequestError(f"Failed to connect to {url}: {e}", url) from e
 
-    # Create SSL context that doesn't verify certificates (like curl -k)
-    ssl_context = ssl.create_default_context()
-    ssl_context.check_hostname = False
-    ssl_context.verify_mode = ssl.CERT_NONE
+    if status >= 400:
+        raise ApiError(status, response_body.decode("utf-8", errors="replace"), url)
+
+    # Both parsers accept bytes directly, so the body is never copied into a str
+    try:
+        return _json_loads(response_body)
+    except json.JSONDecodeError as e:
+        raise RequestError(f"Invalid JSON response from {url}", url) from e
+
+
+def make_request(
+    host_config: dict,
+    method: str,
+    endpoint: str,
+    data: dict | None = None,
+) -> dict:
+    """
+    Make an HTTP request to a node-scoped Proxmox API endpoint
+    (e.g., 'lxc' or 'lxc/100/config'). See api_request.
+    """
+    return api_request(host_config, method, f"nodes/{host_config['node']}/{endpoint}", data)
+
+
+def list_cluster_resources(host_config: dict) -> list[dict]:
+    """List all VMs/LXCs in the cluster in a single request."""
+    response = api_request(host_config, "GET", "cluster/resources?type=vm")
+    return response.get("data", [])
+
+
+def list_node_vms(host_config: dict) -> list[tuple[str, dict]]:
+    """
+    List all VMs/LXCs on the configured node as (vm_type, vm) pairs.
 
+    Uses one /cluster/resources request instead of separate lxc and qemu
+    listings, falling back to those if the cluster endpoint is refused.
+    """
     try:
-        with urllib.request.urlopen(req, context=ssl_context, timeout=30) as response:
-            response_body = response.read().decode("utf-8")
-            return json.loads(response_body)
-    except urllib.error.HTTPError as e:
-        error_body = e.read().decode("utf-8") if e.fp else ""
-        raise ApiError(e.code, error_body, url)
-    except urllib.error.URLError as e:
-        fatal(f"Failed to connect to {url}: {e.reason}")
-    except json.JSONDecodeError:
-        fatal(f"Invalid JSON response from {url}")
+        resources = list_cluster_resources(host_config)
+    except ApiError as e:
+        info(
+            f"Cluster resources unavailable on {host_config['ip']} (HTTP {e.status_code}), "
+            "listing node VMs instead"
+        )
+        return [
+            (vm_type, vm)
+            for vm_type in ("lxc", "qemu")
+            for vm in list_vms(host_config, vm_type)
+        ]
 
-    return {}  # unreachable, but satisfies type checker
+    return [
+        (vm["type"], vm)
+        for vm in resources
+        if vm.get("type") in ("lxc", "qemu") and vm.get("node") == host_config["node"]
+    ]
 
 
 def list_vms(host_config: dict, vm_type: str) -> list[dict]:
@@ -137,10 +314,23 @@ def list_vms(host_config: dict, vm_type: str) -> list[dict]:
     return response.get("data", [])
 
 
+def get_vm_config(host_config: dict, vm_type: str, vmid: int) -> dict:
+    """
+    Get the full config for a VM/LXC.
+    Cached for the rest of the run, so the config read during discovery is
+    reused when snapshotting the matched VM.
+    """
+    key = (host_config["ip"], host_config["node"], vm_type, vmid)
+    config = _config_cache.get(key)
+    if config is None:
+        response = make_request(host_config, "GET", f"{vm_type}/{vmid}/config")
+        config = _config_cache[key] = response.get("data", {})
+    return config
+
+
 def get_lxc_config(host_config: dict, vmid: int) -> dict:
     """Get the full config for an LXC container."""
-    response = make_request(host_config, "GET", f"lxc/{vmid}/config")
-    return response.get("data", {})
+    return get_vm_config(host_config, "lxc", vmid)
 
 
 def get_local_macs() -> set[str]:
@@ -177,11 +367,133 @@ def extract_mac_from_net_config(net_value: str) -> str | None:
 
 def get_vm_mac(host_config: dict, vm_type: str, vmid: int) -> str | None:
     """Get the MAC address from a VM/LXC's net0 config."""
-    config = make_request(host_config, "GET", f"{vm_type}/{vmid}/config")
-    net0 = config.get("data", {}).get("net0", "")
+    net0 = get_vm_config(host_config, vm_type, vmid).get("net0", "")
     return extract_mac_from_net_config(net0)
 
 
+@functools.cache
+def get_local_hostname() -> str:
+    """Get the local short hostname, lowercased, for comparing with VM names."""
+    return socket.gethostname().split(".")[0].lower()
+
+
+def first_match(func: Callable[[Any], Any], items: list, max_workers: int) -> Any:
+    """
+    Call func on each item concurrently and return the first non-None result,
+    or None once every call has returned None.
+
+    Calls run on daemon threads, at most max_workers at a time. Daemon threads
+    are not joined at interpreter exit, so once a match is returned a slow or
+    unreachable Proxmox host never holds up the rest of the run. Exceptions
+    raised by func are re-raised in the caller.
+    """
+    import queue
+
+    results: queue.Queue = queue.Queue()
+    slots = threading.BoundedSemaphore(max_workers)
+
+    def worker(item: Any) -> None:
+        with slots:
+            try:
+                results.put((func(item), None))
+            except BaseException as e:  # incl. SystemExit, or the caller would wait forever
+                results.put((None, e))
+
+    for item in items:
+        threading.Thread(target=worker, args=(item,), daemon=True).start()
+
+    for _ in items:
+        result, error = results.get()
+        if error is not None:
+            raise error
+        if result is not None:
+            return result
+
+    return None
+
+
+def check_vm(
+    host_config: dict, vm_type: str, vm: dict, local_macs: set[str], found: threading.Event
+) -> tuple[dict, str, int] | None:
+    """
+    Check whether a single VM/LXC's net0 MAC matches a local MAC address.
+    A VM whose config cannot be read is reported and treated as no match.
+    """
+    if found.is_set():
+        return None
+    vmid = vm["vmid"]
+    try:
+        mac = get_vm_mac(host_config, vm_type, vmid)
+    except RequestError as e:
+        print(f"WARNING: Skipping {vm_type.upper()} {vmid}: {e}", file=sys.stderr)
+        return None
+    if mac and mac in local_macs:
+        name = vm.get("name", "?")
+        info(f"Found {vm_type.upper()} {vmid} ({name}) matching MAC {mac}")
+        return (host_config, vm_type, vmid)
+    return None
+
+
+def search_proxmox_host(
+    host_config: dict,
+    local_macs: set[str],
+    hostname: str,
+    found: threading.Event,
+    errors: list[RequestError],
+) -> tuple[dict, str, int] | None:
+    """
+    Search a single Proxmox instance for a VM/LXC whose net0 MAC matches
+    one of the local machine's MAC addresses.
+
+    VMs whose name matches the local hostname are checked first, so the
+    common case needs a single config lookup. The MAC remains the
+    authoritative match. The remaining VMs are then checked concurrently.
+    Stops early once `found` is set by a search on another instance.
+
+    An instance whose VMs cannot be listed is reported, recorded in `errors`
+    and treated as no match, so the other instances are still searched.
+    Once another instance has matched, such failures are ignored silently.
+    """
+    if found.is_set():
+        return None
+    info(f"Searching Proxmox at {host_config['ip']}...")
+
+    try:
+        vms = list_node_vms(host_config)
+    except RequestError as e:
+        if found.is_set():
+            return None
+        print(f"WARNING: Skipping Proxmox at {host_config['ip']}: {e}", file=sys.stderr)
+        errors.append(e)
+        return None
+
+    preferred = []
+    others = []
+    for vm_type, vm in vms:
+        if vm.get("vmid") is None:
+            continue
+        if vm.get("status") != "running":
+            continue
+        if str(vm.get("name", "")).lower() == hostname:
+            preferred.append((vm_type, vm))
+        else:
+            others.append((vm_type, vm))
+
+    for vm_type, vm in preferred:
+        result = check_vm(host_config, vm_type, vm, local_macs, found)
+        if result is not None:
+            return result
+
+    if not others or found.is_set():
+        return None
+
+    return first_match(
+        lambda candidate: check_vm(host_config, *candidate, local_macs, found),
+        others,
+        DISCOVERY_MAX_WORKERS,
+    )
+
+
 def find_host_in_proxmox(
     hosts: list[dict], local_macs: set[str]
 ) -> tuple[dict, str, int] | None:
@@ -189,25 +501,130 @@ def find_host_in_proxmox(
     Search all Proxmox instances for a VM/LXC whose net0 MAC matches
     one of the local machine's MAC addresses.
 
+    Instances are searched concurrently and the first match is returned
+    immediately; searches still running on other instances are abandoned
+    and issue no further lookups. Unreachable instances are skipped.
+
     Returns:
         Tuple of (host_config, vm_type, vmid) if found, None otherwise
+
+    Raises:
+        RequestError: if no instance matched and every one of them failed
     """
+    hostname = get_local_hostname()
+    found = threading.Event()
+    errors: list[RequestError] = []
+
+    try:
+        result = first_match(
+            lambda host_config: search_proxmox_host(
+                host_config, local_macs, hostname, found, errors
+            ),
+            hosts,
+            DISCOVERY_MAX_HOSTS,
+        )
+    finally:
+        found.set()
+
+    if result is not None:
+        return result
+
+    if len(errors) == len(hosts):
+        raise errors[0]
+
+    return None
+
+
+def read_discovery_cache() -> dict:
+    """Read the hostname -> VM location cache, returning {} if missing or unreadable."""
+    try:
+        cache = json.loads(DISCOVERY_CACHE_PATH.read_text())
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def write_discovery_cache(cache: dict) -> None:
+    """Atomically replace the discovery cache file. Failures are ignored."""
+    import tempfile
+
+    # mkstemp creates a fresh file with O_EXCL, so a planted symlink in /tmp is never followed
+    try:
+        fd, tmp_name = tempfile.mkstemp(
+            dir=DISCOVERY_CACHE_PATH.parent, prefix=f"{DISCOVERY_CACHE_PATH.name}.", suffix=".tmp"
+        )
+    except OSError:
+        return
+
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(json.dumps(cache))
+        os.replace(tmp_name, DISCOVERY_CACHE_PATH)
+    except OSError:
+        Path(tmp_name).unlink(missing_ok=True)
+
+
+def save_cached_location(hostname: str, host_config: dict, vm_type: str, vmid: int) -> None:
+    """Remember where this host was found so the next run can skip discovery."""
+    cache = read_discovery_cache()
+    cache[hostname] = {
+        "ip": host_config["ip"],
+        "node": host_config["node"],
+        "vm_type": vm_type,
+        "vmid": vmid,
+        "cached_at": time.time(),
+    }
+    write_discovery_cache(cache)
+
+
+def forget_cached_location(hostname: str) -> None:
+    """Drop this host's entry from the discovery cache."""
+    cache = read_discovery_cache()
+    if cache.pop(hostname, None) is not None:
+        write_discovery_cache(cache)
+
+
+def find_cached_host(
+    hosts: list[dict], hostname: str, local_macs: set[str]
+) -> tuple[dict, str, int] | None:
+    """
+    Look up this host's VM/LXC in the discovery cache.
+
+    A fresh entry is only trusted after its net0 MAC is re-checked against
+    the local MACs (one config request, reused later by the snapshot path).
+    Stale or mismatching entries are dropped.
+
+    Returns:
+        Tuple of (host_config, vm_type, vmid) if usable, None otherwise
+    """
+    entry = read_discovery_cache().get(hostname)
+    if not isinstance(entry, dict):
+        return None
+    cached_at = entry.get("cached_at")
+    if not isinstance(cached_at, (int, float)) or time.time() - cached_at >= DISCOVERY_CACHE_TTL:
+        return None
+
     for host_config in hosts:
-        info(f"Searching Proxmox at {host_config['ip']}...")
-
-        for vm_type in ("lxc", "qemu"):
-            for vm in list_vms(host_config, vm_type):
-                vmid = vm.get("vmid")
-                if vmid is None:
-                    continue
-                if vm.get("status") != "running":
-                    continue
-                mac = get_vm_mac(host_config, vm_type, vmid)
-                if mac and mac in local_macs:
-                    name = vm.get("name", "?")
-                    info(f"Found {vm_type.upper()} {vmid} ({name}) matching MAC {mac}")
-                    return (host_config, vm_type, vmid)
+        if host_config["ip"] == entry.get("ip") and host_config["node"] == entry.get("node"):
+            break
+    else:
+        return None
+
+    vm_type, vmid = entry.get("vm_type"), entry.get("vmid")
+    if vm_type not in ("lxc", "qemu") or not isinstance(vmid, int):
+        return None
+
+    try:
+        mac = get_vm_mac(host_config, vm_type, vmid)
+    except RequestError:
+        mac = None
+
+    if mac and mac in local_macs:
+        info(f"Using cached location {vm_type.upper()} {vmid} on {host_config['ip']}")
+        return (host_config, vm_type, vmid)
 
+    info(f"Cached location {vm_type}/{vmid} on {host_config['ip']} no longer matches")
+    forget_cached_location(hostname)
     return None
 
 
@@ -219,18 +636,22 @@ class TaskError(Exception):
         super().__init__(f"Task failed with status: {exitstatus}")
 
 
-def wait_for_task(host_config: dict, upid: str) -> None:
+def wait_for_task(host_config: dict, upid: str, vm_type: str, vmid: int) -> None:
     """
-    Poll a Proxmox task until it completes.
+    Poll a Proxmox task running on the given VM/LXC until it completes.
     Raises TaskError if the task fails, or exits on timeout.
+
+    Polls quickly at first so short tasks return promptly, then backs off
+    exponentially to limit API calls on long-running tasks.
     """
-    info(f"Waiting for task {upid}...")
+    info(f"Waiting for task {upid} on {vm_type}/{vmid}...")
     start_time = time.time()
+    delay = TASK_POLL_INITIAL
 
     while True:
         elapsed = time.time() - start_time
         if elapsed > TASK_TIMEOUT:
-            fatal(f"Task timed out after {TASK_TIMEOUT} seconds")
+            fatal(f"Task on {vm_type}/{vmid} timed out after {TASK_TIMEOUT} seconds")
 
         response = make_request(host_config, "GET", f"tasks/{upid}/status")
         status = response.get("data", {})
@@ -238,12 +659,13 @@ def wait_for_task(host_config: dict, upid: str) -> None:
         if status.get("status") == "stopped":
             exitstatus = status.get("exitstatus", "")
             if exitstatus == "OK":
-                info("Task completed successfully")
+                info(f"Task on {vm_type}/{vmid} completed successfully")
                 return
             else:
                 raise TaskError(exitstatus)
 
-        time.sleep(TASK_POLL_INTERVAL)
+        time.sleep(min(delay, max(TASK_TIMEOUT - elapsed, 0)))
+        delay = min(delay * TASK_POLL_BACKOFF, TASK_POLL_MAX)
 
 
 def create_snapshot_request(
@@ -297,17 +719,16 @@ def has_bind_mounts(config: dict) -> list[str]:
 
     Bind mounts have a source path starting with '/' (e.g., '/mnt/data,mp=/data').
     """
-    bind_mounts = []
-    for key, value in config.items():
-        if key.startswith("mp") and isinstance(value, str):
-            # Mount point format: "source,mp=destination[,options]"
-            # Bind mounts have source starting with /
-            if value.startswith("/"):
-                bind_mounts.append(key)
-    return bind_mounts
+    # Mount point format: "source,mp=destination[,options]"
+    # Bind mounts have source starting with /
+    return [
+        key
+        for key, value in config.items()
+        if MP_KEY_RE.fullmatch(key) and isinstance(value, str) and value.startswith("/")
+    ]
 
 
-def create_lxc_snapshot(host_config: dict, vmid: int) -> bool:
+def create_lxc_snapshot(host_config: dict, vmid: int, snapname: str, description: str) -> bool:
     """
     Create a snapshot for an LXC container.
     Returns True if snapshot was created, False if skipped.
@@ -326,15 +747,34 @@ def create_lxc_snapshot(host_config: dict, vmid: int) -> bool:
         )
         return False
 
-    return try_create_snapshot(host_config, "lxc", vmid)
+    return try_create_snapshot(host_config, "lxc", vmid, snapname, description)
 
 
-def create_qemu_snapshot(host_config: dict, vmid: int) -> bool:
+def create_qemu_snapshot(host_config: dict, vmid: int, snapname: str, description: str) -> bool:
     """Create a snapshot for a QEMU VM."""
-    return try_create_snapshot(host_config, "qemu", vmid)
+    return try_create_snapshot(host_config, "qemu", vmid, snapname, description)
+
+
+@functools.cache
+def get_stack_name() -> str:
+    """Get the name of the stack being deployed (the working directory's name)."""
+    return os.path.basename(os.getcwd())
+
+
+def snapshot_names() -> tuple[str, str]:
+    """Build the (snapname, description) pair for a pre-deploy snapshot."""
+    from datetime import datetime
 
+    now = datetime.now()
+    stack = get_stack_name()
+    snapname = f"pre_deploy_{now.strftime('%d_%m_%Y_%H_%M_%S')}"
+    description = f"Pre-deployment of stack {stack} at {now}"
+    return snapname, description
 
-def try_create_snapshot(host_config: dict, vm_type: str, vmid: int) -> bool:
+
+def try_create_snapshot(
+    host_config: dict, vm_type: str, vmid: int, snapname: str, description: str
+) -> bool:
     """
     Create a snapshot, skipping if a recent one already exists.
     Handles the race condition where another concurrent deploy creates
@@ -349,45 +789,99 @@ def try_create_snapshot(host_config: dict, vm_type: str, vmid: int) -> bool:
         )
         return True
 
-    timestamp = datetime.now().strftime("%d_%m_%Y_%H_%M_%S")
-    stack = os.path.basename(os.getcwd())
-    snapname = f"pre_deploy_{timestamp}"
-    description = f"Pre-deployment of stack {stack} at {datetime.now()}"
-
-    info(f"Creating snapshot '{snapname}'...")
+    info(f"Creating snapshot '{snapname}' on {vm_type}/{vmid}...")
     try:
         upid = create_snapshot_request(host_config, vm_type, vmid, snapname, description)
-        wait_for_task(host_config, upid)
+        wait_for_task(host_config, upid, vm_type, vmid)
     except ApiError as e:
         if "already used" in e.body or "already exists" in e.body:
-            info(f"Snapshot '{snapname}' was just created by another deploy. Skipping.")
+            info(
+                f"Snapshot '{snapname}' on {vm_type}/{vmid} was just created "
+                "by another deploy. Skipping."
+            )
             return True
-        fatal(str(e))
+        fatal(f"{vm_type}/{vmid}: {e}")
     except TaskError as e:
         if "already used" in e.exitstatus or "already exists" in e.exitstatus:
-            info(f"Snapshot '{snapname}' was just created by another deploy. Skipping.")
+            info(
+                f"Snapshot '{snapname}' on {vm_type}/{vmid} was just created "
+                "by another deploy. Skipping."
+            )
             return True
-        fatal(str(e))
+        fatal(f"{vm_type}/{vmid}: {e}")
 
     return True
 
 
-def snapshot_vm(host_config: dict, vm_type: str, vmid: int) -> bool:
+def snapshot_vm(
+    host_config: dict, vm_type: str, vmid: int, snapname: str, description: str
+) -> bool:
     """
     Dispatch to the appropriate snapshot function based on VM type.
     Returns True if snapshot was created, False if skipped.
     """
     if vm_type == "lxc":
-        return create_lxc_snapshot(host_config, vmid)
+        return create_lxc_snapshot(host_config, vmid, snapname, description)
     elif vm_type == "qemu":
-        return create_qemu_snapshot(host_config, vmid)
+        return create_qemu_snapshot(host_config, vmid, snapname, description)
     else:
         fatal(f"Unknown VM type: {vm_type}")
         return False  # unreachable
 
 
-def main() -> None:
-    """Main entry point."""
+def snapshot_many(
+    host_config: dict, targets: list[tuple[str, int]], snapname: str, description: str
+) -> bool:
+    """
+    Snapshot several VMs/LXCs on one Proxmox host concurrently.
+    Returns True if every snapshot was created, False if any were skipped.
+
+    All targets share one snapname so the batch can be rolled back together.
+    A failing snapshot does not abort the others; failures are reported and
+    the script exits once every worker has finished.
+    """
+    if not targets:
+        return True
+    if len(targets) == 1:
+        # Nothing to overlap; skip spinning up (and importing) the thread pool
+        vm_type, vmid = targets[0]
+        return snapshot_vm(host_config, vm_type, vmid, snapname, description)
+
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    workers = min(SNAPSHOT_MAX_WORKERS, len(targets))
+    all_created = True
+    failed = []
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(
+                snapshot_vm, host_config, vm_type, vmid, snapname, description
+            ): (vm_type, vmid)
+            for vm_type, vmid in targets
+        }
+        for future in as_completed(futures):
+            vm_type, vmid = futures[future]
+            try:
+                if not future.result():
+                    all_created = False
+            except RequestError as e:
+                print(f"ERROR: {e}", file=sys.stderr)
+                failed.append(f"{vm_type}/{vmid}")
+            except SystemExit:
+                failed.append(f"{vm_type}/{vmid}")
+
+    if failed:
+        fatal(f"Snapshot failed for {', '.join(sorted(failed))}")
+
+    return all_created
+
+
+def run() -> None:
+    """Find this host in Proxmox and snapshot it."""
+    # Fix the snapshot name at start-up so every snapshot and retry in this run agrees
+    snapname, description = snapshot_names()
+
     # Load configuration from PROXMOX_CONFIG env var
     info("Loading config from PROXMOX_CONFIG environment variable")
     config = load_config()
@@ -396,8 +890,14 @@ def main() -> None:
     local_macs = get_local_macs()
     info(f"Local MAC addresses: {', '.join(sorted(local_macs))}")
 
-    # Find this host in Proxmox
-    result = find_host_in_proxmox(config["proxmox_hosts"], local_macs)
+    # Find this host in Proxmox, trying the discovery cache first
+    hosts = config["proxmox_hosts"]
+    hostname = get_local_hostname()
+    result = find_cached_host(hosts, hostname, local_macs)
+    if result is None:
+        result = find_host_in_proxmox(hosts, local_macs)
+        if result is not None:
+            save_cached_location(hostname, *result)
 
     if result is None:
         print(
@@ -410,11 +910,19 @@ def main() -> None:
     host_config, vm_type, vmid = result
 
     # Create snapshot
-    if snapshot_vm(host_config, vm_type, vmid):
+    if snapshot_many(host_config, [(vm_type, vmid)], snapname, description):
         info("Snapshot completed successfully!")
     else:
         info("Snapshot skipped (see warning above). Deployment will continue.")
 
 
+def main() -> None:
+    """Main entry point."""
+    try:
+        run()
+    except RequestError as e:
+        fatal(str(e))
+
+
 if __name__ == "__main__":
     main()